@@ -60,9 +60,11 @@ Methods
 * __repr__() <==> repr(T)
 * __setitem__(k, v) <==> T[k] = v, O(log(n))
 * clear() -> None, Remove all items from T, , O(n)
-* copy() -> a shallow copy of T, O(n*log(n))
+* copy() -> a shallow copy of T, O(n) (Python trees), O(n*log(n)) (Cython trees)
 * discard(k) -> None, remove k from T, if k is present, O(log(n))
 * get(k[,d]) -> T[k] if k in T, else d, O(log(n))
+* get_many(keys[,d]) -> list of T.get(k, d) for all k in keys, O(k*log(n)), Python trees search a sorted snapshot of T, building the snapshot for a big batch costs O(n) once until T is modified
+* freeze() -> None, Python trees search a sorted snapshot of T for lookups until T is modified, O(n)
 * is_empty() -> True if len(T) == 0, O(1)
 * items([reverse]) -> list of T's (k, v) pairs, as 2-tuple, O(n)
 * keys([reverse]) -> list of T's keys, O(n)
@@ -70,7 +72,7 @@ Methods
 * pop(k[,d]) -> v, remove specified key and return the corresponding value, O(log(n))
 * pop_item() -> (k, v), remove and return some (key, value) pair as a 2-tuple, O(log(n))
 * set_default(k[,d]) -> T.get(k, d), also set T[k]=d if k not in T, O(log(n))
-* update(E) -> None.  Update T from dict/iterable E, O(E*log(n))
+* update(E) -> None.  Update T from dict/iterable E, O(E*log(n)), Python trees rebuild in O(n+E*log(E)) if len(E) >= len(T)
 * iter_items(s, e, reverse) -> generator for (k, v) items of T for s <= key < e, O(n)
 
 walk forward/backward, O(log(n))
@@ -122,7 +124,7 @@ Heap methods
 * nlargest(i[,pop]) -> get list of i largest items (k, v), O(i*log(n))
 * nsmallest(i[,pop]) -> get list of i smallest items (k, v), O(i*log(n))
 
-Set methods (using frozenset)
+Set methods (sorted merge of tree items)
 
 * intersection(t1, t2, ...) -> Tree with keys *common* to all trees
 * union(t1, t2, ...) -> Tree with keys from *either* trees
@@ -12,7 +12,11 @@ import sys
 PYPY = hasattr(sys, 'pypy_version_info')
 
 from .treeslice import TreeSlice
-from operator import attrgetter
+from operator import itemgetter
+from bisect import bisect_left
+from itertools import islice
+
+_GET_KEY = itemgetter(0)  # key of a (key, value) item
 
 
 class _ABCTree(object):
@@ -90,6 +94,8 @@ class _ABCTree(object):
     * copy() -> a shallow copy of T, O(n*log(n))
     * discard(k) -> None, remove k from T, if k is present, O(log(n))
     * get(k[,d]) -> T[k] if k in T, else d, O(log(n))
+    * get_many(keys[,d]) -> list of T.get(k, d) for all k in keys, O(keys*log(n))
+    * freeze() -> None, prepare T for lookups in a rarely modified tree
     * is_empty() -> True if len(T) == 0, O(1)
     * keys([reverse]) -> generator for keys of T, O(n)
     * values([reverse]) -> generator for values of  T, O(n)
@@ -144,7 +150,7 @@ class _ABCTree(object):
     * nlargest(i[,pop]) -> get list of i largest items (k, v), O(i*log(n))
     * nsmallest(i[,pop]) -> get list of i smallest items (k, v), O(i*log(n))
 
-    Set methods (using frozenset)
+    Set methods (sorted merge of tree items)
 
     * intersection(t1, t2, ...) -> Tree with keys *common* to all trees
     * union(t1, t2, ...) -> Tree with keys from *either* trees
@@ -162,8 +168,8 @@ class _ABCTree(object):
 
     def __repr__(self):
         """T.__repr__(...) <==> repr(x)"""
-        tpl = "%s({%s})" % (self.__class__.__name__, '%s')
-        return tpl % ", ".join( ("%r: %r" % item for item in self.items()) )
+        items = ["%r: %r" % item for item in self.items()]
+        return "%s({%s})" % (self.__class__.__name__, ", ".join(items))
 
     def copy(self):
         """T.copy() -> get a shallow copy of T."""
@@ -259,15 +265,20 @@ class _ABCTree(object):
     def __delitem__(self, key):
         """T.__delitem__(y) <==> del x[y]"""
         if isinstance(key, slice):
-            self.remove_items(self.key_slice(key.start, key.stop))
+            self._delete_range(key.start, key.stop)
         else:
             self.remove(key)
 
+    def _delete_range(self, start_key, end_key):
+        """Remove all items with keys in range start_key <= key < end_key."""
+        self.remove_items(self.key_slice(start_key, end_key))
+
     def remove_items(self, keys):
         """T.remove_items(keys) -> None, remove items by keys"""
-        # convert generator to a tuple, because the content of the
-        # tree will be modified!
-        for key in tuple(keys):
+        # convert generator to a sorted list, because the content of the
+        # tree will be modified! Removing in key order searches along
+        # neighbouring paths.
+        for key in sorted(keys):
             self.remove(key)
 
     def key_slice(self, start_key, end_key, reverse=False):
@@ -340,6 +351,16 @@ class _ABCTree(object):
         except KeyError:
             return default
 
+    def get_many(self, keys, default=None):
+        """T.get_many(keys[,d]) -> list of T.get(k, d) for all k in keys."""
+        return [self.get(key, default) for key in keys]
+
+    def freeze(self):
+        """T.freeze() -> None, prepare T for lookups in a rarely modified tree,
+        does nothing here - the Cython trees do all lookups in C.
+        """
+        pass
+
     def pop(self, key, *args):
         """T.pop(k[,d]) -> v, remove specified key and return the corresponding value.
         If key is not found, d is returned if given, otherwise KeyError is raised
@@ -411,8 +432,8 @@ class _ABCTree(object):
         if pop:
             return [self.pop_min() for _ in range(min(len(self), n))]
         else:
-            items = self.items()
-            return [next(items) for _ in range(min(len(self), n))]
+            # the iterator stops walking the tree after n items
+            return list(islice(self.items(), max(n, 0)))
 
     def nlargest(self, n, pop=False):
         """T.nlargest(n) -> get list of n largest items (k, v).
@@ -421,62 +442,157 @@ class _ABCTree(object):
         if pop:
             return [self.pop_max() for _ in range(min(len(self), n))]
         else:
-            items = self.items(reverse=True)
-            return [next(items) for _ in range(min(len(self), n))]
+            return list(islice(self.items(reverse=True), max(n, 0)))
 
     def intersection(self, *trees):
         """T.intersection(t1, t2, ...) -> Tree, with keys *common* to all trees
         """
-        thiskeys = frozenset(self.keys())
-        sets = _build_sets(trees)
-        rkeys = thiskeys.intersection(*sets)
-        return self.__class__(((key, self.get(key)) for key in rkeys))
+        if not _all_trees(trees):
+            thiskeys = frozenset(self.keys())
+            sets = _build_sets(trees)
+            rkeys = thiskeys.intersection(*sets)
+            return self.__class__(((key, self.get(key)) for key in rkeys))
+        items = self.iter_items()
+        for tree in trees:
+            items = _sorted_merge(items, tree.iter_items(), 'and')
+        return self.__class__(items)
 
     def union(self, *trees):
         """T.union(t1, t2, ...) -> Tree with keys from *either* trees
         """
-        thiskeys = frozenset(self.keys())
-        rkeys = thiskeys.union(*_build_sets(trees))
-        all_trees = [self]
-        all_trees.extend(trees)
-        return self.__class__(((key, _multi_tree_get(all_trees, key)) for key in rkeys))
+        if not _all_trees(trees):
+            thiskeys = frozenset(self.keys())
+            rkeys = thiskeys.union(*_build_sets(trees))
+            all_trees = [self]
+            all_trees.extend(trees)
+            return self.__class__(((key, _multi_tree_get(all_trees, key)) for key in rkeys))
+        items = self.iter_items()
+        for tree in trees:
+            items = _sorted_merge(items, tree.iter_items(), 'or')
+        return self.__class__(items)
 
     def difference(self, *trees):
         """T.difference(t1, t2, ...) -> Tree with keys in T but not any of t1,
         t2, ...
         """
-        thiskeys = frozenset(self.keys())
-        rkeys = thiskeys.difference(*_build_sets(trees))
-        return self.__class__(((key, self.get(key)) for key in rkeys))
+        if not _all_trees(trees):
+            thiskeys = frozenset(self.keys())
+            rkeys = thiskeys.difference(*_build_sets(trees))
+            return self.__class__(((key, self.get(key)) for key in rkeys))
+        items = self.iter_items()
+        for tree in trees:
+            items = _sorted_merge(items, tree.iter_items(), 'sub')
+        return self.__class__(items)
 
     def symmetric_difference(self, tree):
         """T.symmetric_difference(t1) -> Tree with keys in either T and t1 but
         not both
         """
-        thiskeys = frozenset(self.keys())
-        rkeys = thiskeys.symmetric_difference(frozenset(tree.keys()))
-        all_trees = [self, tree]
-        return self.__class__(((key, _multi_tree_get(all_trees, key)) for key in rkeys))
+        if not _all_trees((tree,)):
+            thiskeys = frozenset(self.keys())
+            rkeys = thiskeys.symmetric_difference(frozenset(tree.keys()))
+            all_trees = [self, tree]
+            return self.__class__(((key, _multi_tree_get(all_trees, key)) for key in rkeys))
+        return self.__class__(_sorted_merge(self.iter_items(), tree.iter_items(), 'xor'))
 
     def is_subset(self, tree):
         """T.issubset(tree) -> True if every element in x is in tree """
-        thiskeys = frozenset(self.keys())
-        return thiskeys.issubset(frozenset(tree.keys()))
+        if not _all_trees((tree,)):
+            thiskeys = frozenset(self.keys())
+            return thiskeys.issubset(frozenset(tree.keys()))
+        # stops at the first key of T which is not in tree
+        for _ in _sorted_merge(self.iter_items(), tree.iter_items(), 'sub'):
+            return False
+        return True
     issubset = is_subset  # for compatibility to set()
 
     def is_superset(self, tree):
         """T.issubset(tree) -> True if every element in tree is in x """
-        thiskeys = frozenset(self.keys())
-        return thiskeys.issuperset(frozenset(tree.keys()))
+        if not _all_trees((tree,)):
+            thiskeys = frozenset(self.keys())
+            return thiskeys.issuperset(frozenset(tree.keys()))
+        for _ in _sorted_merge(tree.iter_items(), self.iter_items(), 'sub'):
+            return False
+        return True
     issuperset = is_superset  # for compatibility to set()
 
     def is_disjoint(self, tree):
         """T.isdisjoint(S) ->  True if x has a null intersection with tree """
-        thiskeys = frozenset(self.keys())
-        return thiskeys.isdisjoint(frozenset(tree.keys()))
+        if not _all_trees((tree,)):
+            thiskeys = frozenset(self.keys())
+            return thiskeys.isdisjoint(frozenset(tree.keys()))
+        # stops at the first common key
+        for _ in _sorted_merge(self.iter_items(), tree.iter_items(), 'and'):
+            return False
+        return True
     isdisjoint = is_disjoint  # for compatibility to set()
 
 
+def _all_trees(trees):
+    return all(isinstance(tree, _ABCTree) for tree in trees)
+
+
+def _sorted_merge(iter_a, iter_b, mode):
+    """Merge two (key, value) iterators in ascending key order.
+
+    mode 'and': items with keys in a and b, values from a
+    mode 'or': items with keys in a or b, values from a if key in a
+    mode 'sub': items with keys in a but not in b
+    mode 'xor': items with keys in a or b but not in both
+    mode 'update': items with keys in a or b, the key object from a and the
+    value from b if key in a and b
+    """
+    emit_a = mode in ('or', 'sub', 'xor', 'update')  # key only in a
+    emit_b = mode in ('or', 'xor', 'update')  # key only in b
+    emit_both = mode in ('and', 'or')  # key in a and b, item from a
+    update = mode == 'update'  # key in a and b, key from a, value from b
+    iter_a = iter(iter_a)
+    iter_b = iter(iter_b)
+    item_a = next(iter_a, None)
+    item_b = next(iter_b, None)
+    while item_a is not None and item_b is not None:
+        if item_a[0] < item_b[0]:
+            if emit_a:
+                yield item_a
+            item_a = next(iter_a, None)
+        elif item_b[0] < item_a[0]:
+            if emit_b:
+                yield item_b
+            item_b = next(iter_b, None)
+        else:
+            if emit_both:
+                yield item_a
+            elif update:
+                yield item_a[0], item_b[1]
+            item_a = next(iter_a, None)
+            item_b = next(iter_b, None)
+    if emit_a and item_a is not None:
+        yield item_a
+        for item in iter_a:
+            yield item
+    if emit_b and item_b is not None:
+        yield item_b
+        for item in iter_b:
+            yield item
+
+
+def _unique_sorted_items(items):
+    """Sort (key, value) pairs by key, for equal keys the first key object
+    and the last value is kept, like inserting the pairs one by one.
+    """
+    result = []
+    for item in sorted(items, key=_GET_KEY):  # stable sort
+        if result and item[0] == result[-1][0]:
+            result[-1] = result[-1][0], item[1]
+        else:
+            result.append(item)
+    return result
+
+
+def _in_any_range(key):
+    return True
+
+
 def _build_sets(trees):
     return [frozenset(tree.keys()) for tree in trees]
 
@@ -500,7 +616,8 @@ class CPYTHON_ABCTree(_ABCTree):
         insert(key, value) <==> T[key] = value, insert key into T
 
     remove(...)
-        remove(key) <==> del T[key], remove key from T
+        remove(key) <==> del T[key], remove key from T, returns the value of
+        the removed item
 
     Properties defined here
     --------------------
@@ -510,6 +627,14 @@ class CPYTHON_ABCTree(_ABCTree):
     Methods defined here
     --------------------
     * __init__() Tree initializer
+    * __contains__(k) -> True if T has a key k, else False
+    * pop(k[,d]) -> v, remove specified key and return the corresponding value
+    * set_default(k[,d]) -> value, T.get(k, d), also set T[k]=d if k not in T
+    * get_many(keys[,d]) -> list of T.get(k, d) for all k in keys, by a sorted snapshot of T
+    * freeze() -> None, lookups search a sorted snapshot of T until T is modified
+    * copy() -> a shallow copy of T, O(n)
+    * update(E) -> None.  Update T from dict/iterable E, O(E*log(n)), O(n+E*log(E)) if len(E) >= len(T)
+    * from_keys(S[,v]) -> New tree with keys from S and values equal to v, O(S*log(S))
     * get_value(key) -> returns value for key
     * clear() -> None.  Remove all items from tree.
     * iter_items(start_key, end_key, [reverse]) -> iterate over all items, yielding (k, v) tuple
@@ -522,6 +647,9 @@ class CPYTHON_ABCTree(_ABCTree):
     * floor_item(key) -> get (k, v) pair, where k is the greatest key less than or equal to key, O(log(n))
     * ceiling_item(key) -> get (k, v) pair, where k is the smallest key greater than or equal to key, O(log(n))
     """
+    # sorted (keys, values) lists of freeze(), reset by each modification
+    _snapshot = None
+
     def __init__(self, items=None):
         """T.__init__(...) initializes T; see T.__class__.__doc__ for signature"""
         self._root = None
@@ -529,23 +657,201 @@ class CPYTHON_ABCTree(_ABCTree):
         if items is not None:
             self.update(items)
 
+    def copy(self):
+        """T.copy() -> get a shallow copy of T."""
+        return self._from_sorted_items(list(self.iter_items()))
+    __copy__ = copy
+
+    def update(self, *args):
+        """T.update(E) -> None. Update T from E : for (k, v) in E: T[k] = v"""
+        items = []
+        for arg in args:
+            try:
+                generator = arg.items()
+            except AttributeError:
+                generator = iter(arg)
+            items.extend(generator)
+
+        if len(items) < self._count:
+            for key, value in items:
+                self.insert(key, value)
+        else:
+            # big batch: merge with the existing items and rebuild the tree,
+            # this is faster than len(items) inserts with rebalancing
+            items = _unique_sorted_items(items)
+            if self._count:
+                items = list(_sorted_merge(self.iter_items(), items, 'update'))
+            self._set_sorted_items(items)
+
+    def _delete_range(self, start_key, end_key):
+        """Remove all items with keys in range start_key <= key < end_key."""
+        # count the range only up to the threshold of 1/8 of all items
+        limit = (self._count + 7) // 8
+        size = sum(1 for node in islice(self._iter_nodes(start_key, end_key), limit))
+        if size < limit:
+            for key in list(self.key_slice(start_key, end_key)):
+                self.remove(key)
+        else:
+            # big range: rebuilding the tree from the remaining items is
+            # faster than removing the items one by one
+            items = []
+            if start_key is not None:
+                items.extend(self.iter_items(None, start_key))
+            if end_key is not None:
+                items.extend(self.iter_items(end_key, None))
+            self._set_sorted_items(items)
+
+    def _set_sorted_items(self, items):
+        """Replace the content of T by a balanced tree build from items, a
+        sequence of (key, value) pairs with unique keys in ascending order.
+        """
+        self._count = 0
+        self._snapshot = None
+        self._root = self._build_sorted_tree(items)
+
+    @classmethod
+    def from_keys(cls, iterable, value=None):
+        """T.from_keys(S[,v]) -> New tree with keys from S and values equal to v."""
+        keys = sorted(iterable)
+        items = [(key, value) for index, key in enumerate(keys)
+                 if index == 0 or key != keys[index - 1]]
+        return cls._from_sorted_items(items)
+    fromkeys = from_keys  # for compatibility to dict()
+
+    @classmethod
+    def _from_sorted_items(cls, items):
+        """Create a new tree of class cls from a sequence of (key, value)
+        pairs with unique keys in ascending order.
+        """
+        tree = cls()
+        tree._set_sorted_items(items)
+        return tree
+
+    def _build_sorted_tree(self, items):
+        """Build a balanced tree from a sequence of (key, value) pairs with
+        unique keys in ascending order, without any rebalancing, O(n).
+
+        Returns the root node, _new_node() counts the created nodes.
+        """
+        new_node = self._new_node
+        init_node = self._init_built_node
+        # height of the tree: the deepest level may be incomplete
+        max_depth = len(items).bit_length() - 1
+
+        def _build(lo, hi, depth):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            key, value = items[mid]
+            node = new_node(key, value)
+            node.left = _build(lo, mid, depth + 1)
+            node.right = _build(mid + 1, hi, depth + 1)
+            init_node(node, depth, max_depth)
+            return node
+        return _build(0, len(items), 0)
+
+    def _init_built_node(self, node, depth, max_depth):
+        """Set balancing data of a node created by _build_sorted_tree(), the
+        children of node are already complete.
+        """
+        pass
+
     def clear(self):
         """T.clear() -> None.  Remove all items from T."""
-        def _clear(node):
-            if node is not None:
-                _clear(node.left)
-                _clear(node.right)
-                node.free()
-        _clear(self._root)
+        # T holds the only references to its nodes, reference counting frees
+        # all nodes without a recursive walk through the tree
         self._count = 0
         self._root = None
+        self._snapshot = None
+
+    def get_many(self, keys, default=None):
+        """T.get_many(keys[,d]) -> list of T.get(k, d) for all k in keys.
+
+        Keys are searched by bisection in the sorted snapshot of freeze(),
+        if the snapshot exists or if the batch is big enough to pay for
+        building it, O(n). The snapshot is reused until T is modified. Small
+        batches without a snapshot search the tree for each key.
+        """
+        keys = list(keys)
+        if self._snapshot is None and len(keys) * self._count.bit_length() < self._count:
+            get = self.get
+            return [get(key, default) for key in keys]
+        self.freeze()
+        tree_keys, tree_values = self._snapshot
+        size = len(tree_keys)
+        result = []
+        for key in keys:
+            index = bisect_left(tree_keys, key)
+            if index < size and tree_keys[index] == key:
+                result.append(tree_values[index])
+            else:
+                result.append(default)
+        return result
 
     @property
     def count(self):
         """Get items count."""
         return self._count
 
+    def __contains__(self, key):
+        """k in T -> True if T has a key k, else False"""
+        if self._snapshot is not None:
+            tree_keys = self._snapshot[0]
+            index = bisect_left(tree_keys, key)
+            return index < len(tree_keys) and tree_keys[index] == key
+        return self._find_node(key) is not None
+
+    def pop(self, key, *args):
+        """T.pop(k[,d]) -> v, remove specified key and return the corresponding value.
+        If key is not found, d is returned if given, otherwise KeyError is raised
+        """
+        if len(args) > 1:
+            raise TypeError("pop expected at most 2 arguments, got %d" % (1 + len(args)))
+        try:
+            return self.remove(key)  # returns the value, no extra search required
+        except KeyError:
+            if len(args) == 0:
+                raise
+            else:
+                return args[0]
+
+    def set_default(self, key, default=None):
+        """T.set_default(k[,d]) -> T.get(k,d), also set T[k]=d if k not in T"""
+        node = self._find_node(key)
+        if node is not None:
+            return node.value
+        self.insert(key, default)
+        return default
+    setdefault = set_default  # for compatibility to dict()
+
+    def _find_node(self, key):
+        """Get the node of key or None, if key does not exist."""
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return node
+            elif key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return None
+
+    def freeze(self):
+        """T.freeze() -> None, create a snapshot of the sorted keys and values
+        of T, get_value() and get_many() search the snapshot by bisection until
+        T is modified. Speeds up lookups of rarely modified trees.
+        """
+        if self._snapshot is None:
+            items = list(self.iter_items())
+            self._snapshot = ([item[0] for item in items], [item[1] for item in items])
+
     def get_value(self, key):
+        if self._snapshot is not None:
+            tree_keys, tree_values = self._snapshot
+            index = bisect_left(tree_keys, key)
+            if index < len(tree_keys) and tree_keys[index] == key:
+                return tree_values[index]
+            raise KeyError(str(key))
         node = self._root
         while node is not None:
             if key == node.key:
@@ -582,18 +888,42 @@ class CPYTHON_ABCTree(_ABCTree):
         parm func: function(key, value)
         param int order: inorder = 0, preorder = -1, postorder = +1
         """
-        def _traverse(node):
-            if order == -1:
-                func(node.key, node.value)
-            if node.left is not None:
-                _traverse(node.left)
-            if order == 0:
-                func(node.key, node.value)
-            if node.right is not None:
-                _traverse(node.right)
-            if order == +1:
+        node = self._root
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        if order == 0:  # inorder
+            while stack or node is not None:
+                if node is not None:
+                    push(node)
+                    node = node.left
+                else:
+                    node = pop()
+                    func(node.key, node.value)
+                    node = node.right
+        elif order == -1:  # preorder
+            if node is not None:
+                push(node)
+            while stack:
+                node = pop()
                 func(node.key, node.value)
-        _traverse(self._root)
+                if node.right is not None:
+                    push(node.right)
+                if node.left is not None:
+                    push(node.left)
+        elif order == +1:  # postorder
+            last = None
+            while stack or node is not None:
+                if node is not None:
+                    push(node)
+                    node = node.left
+                else:
+                    top = stack[-1]
+                    if top.right is not None and top.right is not last:
+                        node = top.right
+                    else:
+                        func(top.key, top.value)
+                        last = pop()
 
     def min_item(self):
         """Get item with min key of tree, raises ValueError if tree is empty."""
@@ -626,8 +956,9 @@ class CPYTHON_ABCTree(_ABCTree):
             if key == node.key:
                 break
             elif key < node.key:
-                if (succ_node is None) or (node.key < succ_node.key):
-                    succ_node = node
+                # all following nodes are in the left subtree of node, so
+                # each new successor candidate is smaller than the last one
+                succ_node = node
                 node = node.left
             else:
                 node = node.right
@@ -640,10 +971,7 @@ class CPYTHON_ABCTree(_ABCTree):
             node = node.right
             while node.left is not None:
                 node = node.left
-            if succ_node is None:
-                succ_node = node
-            elif node.key < succ_node.key:
-                succ_node = node
+            succ_node = node
         elif succ_node is None: # given key is biggest in tree
             raise KeyError(str(key))
         return succ_node.key, succ_node.value
@@ -664,8 +992,8 @@ class CPYTHON_ABCTree(_ABCTree):
             elif key < node.key:
                 node = node.left
             else:
-                if (prev_node is None) or (node.key > prev_node.key):
-                    prev_node = node
+                # each new predecessor candidate is greater than the last one
+                prev_node = node
                 node = node.right
 
         if node is None: # stay at dead end (None)
@@ -676,10 +1004,7 @@ class CPYTHON_ABCTree(_ABCTree):
             node = node.left
             while node.right is not None:
                 node = node.right
-            if prev_node is None:
-                prev_node = node
-            elif node.key > prev_node.key:
-                prev_node = node
+            prev_node = node
         elif prev_node is None: # given key is smallest in tree
             raise KeyError(str(key))
         return prev_node.key, prev_node.value
@@ -697,8 +1022,7 @@ class CPYTHON_ABCTree(_ABCTree):
             elif key < node.key:
                 node = node.left
             else:
-                if (prev_node is None) or (node.key > prev_node.key):
-                    prev_node = node
+                prev_node = node  # greater than the last candidate
                 node = node.right
         # node must be None here
         if prev_node:
@@ -718,14 +1042,43 @@ class CPYTHON_ABCTree(_ABCTree):
             elif key > node.key:
                 node = node.right
             else:
-                if (succ_node is None) or (node.key < succ_node.key):
-                    succ_node = node
+                succ_node = node  # smaller than the last candidate
                 node = node.left
             # node must be None here
         if succ_node:
             return succ_node.key, succ_node.value
         raise KeyError(str(key))
 
+    def keys(self, reverse=False):
+        """T.keys([reverse]) -> an iterator over the keys of T, in ascending
+        order if reverse is True, iterate in descending order, reverse defaults
+        to False
+        """
+        return (node.key for node in self._iter_nodes(reverse=reverse))
+    __iter__ = keys
+
+    def values(self, reverse=False):
+        """T.values([reverse]) -> an iterator over the values of T, in ascending order
+        if reverse is True, iterate in descending order, reverse defaults to False
+        """
+        return (node.value for node in self._iter_nodes(reverse=reverse))
+
+    def key_slice(self, start_key, end_key, reverse=False):
+        """T.key_slice(start_key, end_key) -> key iterator:
+        start_key <= key < end_key.
+
+        Yields keys in ascending order if reverse is False else in descending order.
+        """
+        return (node.key for node in self._iter_nodes(start_key, end_key, reverse))
+
+    def value_slice(self, start_key, end_key, reverse=False):
+        """T.value_slice(start_key, end_key) -> value iterator:
+        start_key <= key < end_key.
+
+        Yields values in ascending key order if reverse is False else in descending key order.
+        """
+        return (node.value for node in self._iter_nodes(start_key, end_key, reverse))
+
     def iter_items(self,  start_key=None, end_key=None, reverse=False):
         """Iterates over the (key, value) items of the associated tree,
         in ascending order if reverse is True, iterate in descending order,
@@ -739,41 +1092,158 @@ class CPYTHON_ABCTree(_ABCTree):
         else:
             return self._iter_items_forward(start_key, end_key)
 
-    def _iter_items_forward(self, start_key=None, end_key=None):
-        for item in self._iter_items(left=attrgetter("left"), right=attrgetter("right"),
-                                     start_key=start_key, end_key=end_key):
-            yield item
-
-    def _iter_items_backward(self, start_key=None, end_key=None):
-        for item in self._iter_items(left=attrgetter("right"), right=attrgetter("left"),
-                                     start_key=start_key, end_key=end_key):
-            yield item
-
-    def _iter_items(self, left=attrgetter("left"), right=attrgetter("right"), start_key=None, end_key=None):
+    def _iter_nodes(self, start_key=None, end_key=None, reverse=False):
+        """Iterates over the nodes of the tree with start_key <= key < end_key."""
+        if self.is_empty():
+            return []
+        if reverse:
+            return self._iter_nodes_backward(start_key, end_key)
+        else:
+            return self._iter_nodes_forward(start_key, end_key)
+
+    # The item and node iterators share the descent to the first key in
+    # range, but each has its own loop: building the (key, value) tuples
+    # from yielded nodes makes items() about 13% slower.
+    # left/right are hard coded for each direction, this avoids the
+    # attrgetter() calls for every visited node
+    # Note: a Morris traversal needs no stack, but it rewrites links of
+    # the tree while the iterator is suspended, so lookups in the loop
+    # body could run in circles - and it is slower on CPython.
+
+    def _seek_forward(self, start_key):
+        """Returns the stack of nodes for an ascending walk from start_key."""
         node = self._root
         stack = []
-        go_left = True
-        in_range = self._get_in_range_func(start_key, end_key)
+        push = stack.append
+        # descend to start_key and skip all subtrees with keys < start_key,
+        # every node visited after this is greater than start_key
+        if start_key is None:
+            while node is not None:
+                push(node)
+                node = node.left
+        else:
+            while node is not None:
+                if node.key < start_key:
+                    node = node.right
+                else:
+                    push(node)
+                    node = node.left
+        return stack
 
-        while True:
-            if left(node) is not None and go_left:
-                stack.append(node)
-                node = left(node)
-            else:
-                if in_range(node.key):
-                    yield node.key, node.value
-                if right(node) is not None:
-                    node = right(node)
-                    go_left = True
+    def _seek_backward(self, end_key):
+        """Returns the stack of nodes for a descending walk from end_key."""
+        node = self._root
+        stack = []
+        push = stack.append
+        # descend to end_key and skip all subtrees with keys >= end_key
+        if end_key is None:
+            while node is not None:
+                push(node)
+                node = node.right
+        else:
+            while node is not None:
+                if node.key >= end_key:
+                    node = node.left
                 else:
-                    if not len(stack):
-                        return  # all done
-                    node = stack.pop()
-                    go_left = False
+                    push(node)
+                    node = node.right
+        return stack
+
+    def _iter_items_forward(self, start_key=None, end_key=None):
+        stack = self._seek_forward(start_key)
+        push = stack.append
+        pop = stack.pop
+        if end_key is None:
+            while stack:
+                node = pop()
+                yield node.key, node.value
+                node = node.right
+                while node is not None:
+                    push(node)
+                    node = node.left
+        else:
+            while stack:
+                node = pop()
+                if node.key >= end_key:
+                    return  # all done, skip the remaining tree
+                yield node.key, node.value
+                node = node.right
+                while node is not None:
+                    push(node)
+                    node = node.left
+
+    def _iter_items_backward(self, start_key=None, end_key=None):
+        stack = self._seek_backward(end_key)
+        push = stack.append
+        pop = stack.pop
+        if start_key is None:
+            while stack:
+                node = pop()
+                yield node.key, node.value
+                node = node.left
+                while node is not None:
+                    push(node)
+                    node = node.right
+        else:
+            while stack:
+                node = pop()
+                if node.key < start_key:
+                    return  # all done, skip the remaining tree
+                yield node.key, node.value
+                node = node.left
+                while node is not None:
+                    push(node)
+                    node = node.right
+
+    def _iter_nodes_forward(self, start_key=None, end_key=None):
+        stack = self._seek_forward(start_key)
+        push = stack.append
+        pop = stack.pop
+        if end_key is None:
+            while stack:
+                node = pop()
+                yield node
+                node = node.right
+                while node is not None:
+                    push(node)
+                    node = node.left
+        else:
+            while stack:
+                node = pop()
+                if node.key >= end_key:
+                    return  # all done, skip the remaining tree
+                yield node
+                node = node.right
+                while node is not None:
+                    push(node)
+                    node = node.left
+
+    def _iter_nodes_backward(self, start_key=None, end_key=None):
+        stack = self._seek_backward(end_key)
+        push = stack.append
+        pop = stack.pop
+        if start_key is None:
+            while stack:
+                node = pop()
+                yield node
+                node = node.left
+                while node is not None:
+                    push(node)
+                    node = node.right
+        else:
+            while stack:
+                node = pop()
+                if node.key < start_key:
+                    return  # all done, skip the remaining tree
+                yield node
+                node = node.left
+                while node is not None:
+                    push(node)
+                    node = node.right
 
     def _get_in_range_func(self, start_key, end_key):
         if start_key is None and end_key is None:
-            return lambda x: True
+            return _in_any_range
         else:
             if start_key is None:
                 start_key = self.min_key()
@@ -119,8 +119,13 @@ class AVLTree(ABCTree):
         self._count += 1
         return Node(key, value)
 
+    def _init_built_node(self, node, depth, max_depth):
+        """Set height of a node created by _build_sorted_tree()."""
+        node.balance = max(height(node.left), height(node.right)) + 1
+
     def insert(self, key, value):
         """T.insert(key, value) <==> T[key] = value, insert key, value into tree."""
+        self._snapshot = None
         if self._root is None:
             self._root = self._new_node(key, value)
         else:
@@ -182,6 +187,7 @@ class AVLTree(ABCTree):
 
     def remove(self, key):
         """T.remove(key) <==> del T[key], remove item <key> from tree."""
+        self._snapshot = None
         if self._root is None:
             raise KeyError(str(key))
         else:
@@ -205,6 +211,7 @@ class AVLTree(ABCTree):
                 node = node[direction]
                 top += 1
 
+            value = node.value
             # Remove the node
             if (node.left is None) or (node.right is None):
                 # Which child is not null?
@@ -271,3 +278,4 @@ class AVLTree(ABCTree):
                     else:
                         self._root = node_stack[0]
                 top -= 1
+            return value
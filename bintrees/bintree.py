@@ -64,6 +64,7 @@ class BinaryTree(ABCTree):
 
     def insert(self, key, value):
         """T.insert(key, value) <==> T[key] = value, insert key, value into tree."""
+        self._snapshot = None
         if self._root is None:
             self._root = self._new_node(key, value)
         else:
@@ -84,6 +85,7 @@ class BinaryTree(ABCTree):
 
     def remove(self, key):
         """T.remove(key) <==> del T[key], remove item <key> from tree."""
+        self._snapshot = None
         node = self._root
         if node is None:
             raise KeyError(str(key))
@@ -92,6 +94,7 @@ class BinaryTree(ABCTree):
             direction = 0
             while True:
                 if key == node.key:
+                    value = node.value
                     # remove node
                     if (node.left is not None) and (node.right is not None):
                         # find replacment node: smallest key in right-subtree
@@ -115,7 +118,7 @@ class BinaryTree(ABCTree):
                             parent[direction] = node[down_dir]
                     node.free()
                     self._count -= 1
-                    break
+                    return value
                 else:
                     direction = 0 if key < node.key else 1
                     parent = node
@@ -20,6 +20,10 @@
 #define RED(node) (node->xdata)
 #define BALANCE(node) (node->xdata)
 
+/* PyMem_Malloc() serves the small node_t structs from the pymalloc pools of
+ * its size class, so nodes are already packed in arenas without a per node
+ * malloc() header - a private node arena would not improve the locality.
+ */
 static node_t *
 ct_new_node(PyObject *key, PyObject *value, int xdata)
 {
@@ -79,6 +83,28 @@ ct_compare(PyObject *key1, PyObject *key2)
 {
 	int res;
 
+	/* fast paths for trees with float or int keys: compare the unboxed
+	   values, mixed or other types use the rich comparison below */
+	if (PyFloat_CheckExact(key1) && PyFloat_CheckExact(key2)) {
+		double d1 = PyFloat_AS_DOUBLE(key1);
+		double d2 = PyFloat_AS_DOUBLE(key2);
+		return (d1 > d2) - (d1 < d2);
+	}
+#if PY_MAJOR_VERSION < 3
+	if (PyInt_CheckExact(key1) && PyInt_CheckExact(key2)) {
+		long l1 = PyInt_AS_LONG(key1);
+		long l2 = PyInt_AS_LONG(key2);
+		return (l1 > l2) - (l1 < l2);
+	}
+#endif
+	if (PyLong_CheckExact(key1) && PyLong_CheckExact(key2)) {
+		int overflow1, overflow2;
+		PY_LONG_LONG l1 = PyLong_AsLongLongAndOverflow(key1, &overflow1);
+		PY_LONG_LONG l2 = PyLong_AsLongLongAndOverflow(key2, &overflow2);
+		if (!overflow1 && !overflow2)
+			return (l1 > l2) - (l1 < l2);
+	}
+
 	res = PyObject_RichCompareBool(key1, key2, Py_LT);
 	if (res > 0)
 		return -1;
@@ -687,13 +713,11 @@ ct_succ_node(node_t *root, PyObject *key)
 		cval = ct_compare(key, KEY(node));
 		if (cval == 0)
 			break;
-		else if (cval < 0) {
-			if ((succ == NULL) ||
-				(ct_compare(KEY(node), KEY(succ)) < 0))
-				succ = node;
-			node = LEFT_NODE(node);
-		} else
-			node = RIGHT_NODE(node);
+		/* all following nodes are in the left subtree of node, so each
+		   new successor candidate is smaller than the last one */
+		if (cval < 0)
+			succ = node;
+		node = LINK(node, (cval > 0));
 	}
 	if (node == NULL)
 		return NULL;
@@ -703,10 +727,7 @@ ct_succ_node(node_t *root, PyObject *key)
 		node = RIGHT_NODE(node);
 		while (LEFT_NODE(node) != NULL)
 			node = LEFT_NODE(node);
-		if (succ == NULL)
-			succ = node;
-		else if (ct_compare(KEY(node), KEY(succ)) < 0)
-			succ = node;
+		succ = node;
 	}
 	return succ;
 }
@@ -722,13 +743,10 @@ ct_prev_node(node_t *root, PyObject *key)
 		cval = ct_compare(key, KEY(node));
 		if (cval == 0)
 			break;
-		else if (cval < 0)
-			node = LEFT_NODE(node);
-		else {
-			if ((prev == NULL) || (ct_compare(KEY(node), KEY(prev)) > 0))
-				prev = node;
-			node = RIGHT_NODE(node);
-		}
+		/* each new predecessor candidate is greater than the last one */
+		if (cval > 0)
+			prev = node;
+		node = LINK(node, (cval > 0));
 	}
 	if (node == NULL) /* stay at dead end (None) */
 		return NULL;
@@ -738,10 +756,7 @@ ct_prev_node(node_t *root, PyObject *key)
 		node = LEFT_NODE(node);
 		while (RIGHT_NODE(node) != NULL)
 			node = RIGHT_NODE(node);
-		if (prev == NULL)
-			prev = node;
-		else if (ct_compare(KEY(node), KEY(prev)) > 0)
-			prev = node;
+		prev = node;
 	}
 	return prev;
 }
@@ -757,13 +772,9 @@ ct_floor_node(node_t *root, PyObject *key)
 		cval = ct_compare(key, KEY(node));
 		if (cval == 0)
 			return node;
-		else if (cval < 0)
-			node = LEFT_NODE(node);
-		else {
-			if ((prev == NULL) || (ct_compare(KEY(node), KEY(prev)) > 0))
-				prev = node;
-			node = RIGHT_NODE(node);
-		}
+		if (cval > 0)
+			prev = node; /* greater than the last candidate */
+		node = LINK(node, (cval > 0));
 	}
 	return prev;
 }
@@ -779,13 +790,9 @@ ct_ceiling_node(node_t *root, PyObject *key)
 		cval = ct_compare(key, KEY(node));
 		if (cval == 0)
 			return node;
-		else if (cval < 0) {
-			if ((succ == NULL) ||
-				(ct_compare(KEY(node), KEY(succ)) < 0))
-				succ = node;
-			node = LEFT_NODE(node);
-		} else
-			node = RIGHT_NODE(node);
+		if (cval < 0)
+			succ = node; /* smaller than the last candidate */
+		node = LINK(node, (cval > 0));
 	}
 	return succ;
 }
@@ -9,19 +9,34 @@
 from .abctree import _ABCTree
 from ctrees cimport *
 
-DEF MAXSTACK = 64
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+
+DEF STACKSIZE = 64
 
 cdef class NodeStack:
-    """Simple stack for tree nodes."""
-    cdef node_t* stack[MAXSTACK]
+    """Simple stack for tree nodes, grows for degenerated trees."""
+    cdef node_t **stack
     cdef int stackptr
+    cdef int size
 
     def __cinit__(self):
+        self.stack = <node_t **>PyMem_Malloc(STACKSIZE * sizeof(node_t *))
+        if self.stack == NULL:
+            raise MemoryError('Can not allocate memory for NodeStack.')
+        self.size = STACKSIZE
         self.stackptr = 0
 
+    def __dealloc__(self):
+        PyMem_Free(self.stack)
+
     cdef push(self, node_t* node):
-        if self.stackptr >= MAXSTACK:
-            raise RuntimeError("Stack overflow in NodeStack.push().")
+        cdef node_t **stack
+        if self.stackptr >= self.size:
+            stack = <node_t **>PyMem_Realloc(self.stack, 2 * self.size * sizeof(node_t *))
+            if stack == NULL:
+                raise MemoryError('Can not allocate memory for NodeStack.')
+            self.stack = stack
+            self.size *= 2
         self.stack[self.stackptr] = node
         self.stackptr += 1
 
@@ -31,6 +46,11 @@ cdef class NodeStack:
         self.stackptr -= 1
         return self.stack[self.stackptr]
 
+    cdef node_t* top(self):
+        if self.stackptr <= 0:
+            raise RuntimeError("Stack underflow in NodeStack.top().")
+        return self.stack[self.stackptr - 1]
+
     cdef bint is_empty(self):
         return self.stackptr == 0
 
@@ -67,6 +87,18 @@ cdef class _BaseTree:
         else:
             return <object> result.value
 
+    def __contains__(self, key):
+        """k in T -> True if T has a key k, else False"""
+        return ct_find_node(self.root, key) != NULL
+
+    def get(self, key, default=None):
+        """T.get(k[,d]) -> T[k] if k in T, else d.  d defaults to None."""
+        cdef node_t *result = ct_find_node(self.root, key)
+        if result == NULL:
+            return default
+        else:
+            return <object> result.value
+
     def max_item(self):
         """Get item with max key of tree, raises ValueError if tree is empty."""
         cdef node_t *node = ct_max_node(self.root)
@@ -125,27 +157,36 @@ cdef class _BaseTree:
             return
         cdef int direction = 1 if reverse else 0
         cdef int other = 1 - direction
-        cdef bint go_down = True
         cdef NodeStack stack = NodeStack()
-        cdef node_t *node
+        cdef node_t *node = self.root
+        cdef bint skip
+
+        # descend to the first key in range and skip all subtrees outside
+        # of the range, every node visited after this is in range until
+        # the first key behind the range
+        while node != NULL:
+            if reverse:
+                skip = end_key is not None and ct_compare(<object>node.key, end_key) >= 0
+            else:
+                skip = start_key is not None and ct_compare(<object>node.key, start_key) < 0
+            if skip:
+                node = node.link[other]
+            else:
+                stack.push(node)
+                node = node.link[direction]
 
-        node = self.root
-        while True:
-            if node.link[direction] != NULL and go_down:
+        while not stack.is_empty():
+            node = stack.pop()
+            if reverse:
+                if start_key is not None and ct_compare(<object>node.key, start_key) < 0:
+                    return  # all done, skip the remaining tree
+            elif end_key is not None and ct_compare(<object>node.key, end_key) >= 0:
+                return  # all done, skip the remaining tree
+            yield <object>node.key, <object>node.value
+            node = node.link[other]
+            while node != NULL:
                 stack.push(node)
                 node = node.link[direction]
-            else:
-                if (start_key is None or ct_compare(start_key, <object>node.key) < 1) and \
-                    (end_key is None or ct_compare(end_key, <object>node.key) > 0):
-                    yield <object>node.key, <object>node.value
-                if node.link[other] != NULL:
-                    node = node.link[other]
-                    go_down = True
-                else:
-                    if stack.is_empty():
-                        return  # all done
-                    node = stack.pop()
-                    go_down = False
 
     def pop_item(self):
         """ T.pop_item() -> (k, v), remove and return some (key, value) pair as a
@@ -171,27 +212,39 @@ cdef class _BaseTree:
             return
         cdef NodeStack stack = NodeStack()
         cdef node_t *node = self.root
-        cdef bint go_down = True
+        cdef node_t *last = NULL
 
-        while True:
-            if order == -1:  # preorder call
-                func(<object>node.key, <object>node.value)
-            if node.link[0] != NULL and go_down:
-                stack.push(node)
-                node = node.link[0]  # go left
-            else:
-                if order == 0:  # inorder call
+        if order == 0:  # inorder
+            while node != NULL or not stack.is_empty():
+                if node != NULL:
+                    stack.push(node)
+                    node = node.link[0]  # go left
+                else:
+                    node = stack.pop()
                     func(<object>node.key, <object>node.value)
-                if node.link[1] != NULL:
                     node = node.link[1]  # go right
-                    go_down = True
+        elif order == -1:  # preorder
+            stack.push(node)
+            while not stack.is_empty():
+                node = stack.pop()
+                func(<object>node.key, <object>node.value)
+                if node.link[1] != NULL:
+                    stack.push(node.link[1])
+                if node.link[0] != NULL:
+                    stack.push(node.link[0])
+        elif order == +1:  # postorder
+            while node != NULL or not stack.is_empty():
+                if node != NULL:
+                    stack.push(node)
+                    node = node.link[0]  # go left
                 else:
-                    if stack.is_empty():
-                        return  # all done
-                    node = stack.pop()
-                    if order == +1:  # postorder call
+                    node = stack.top()
+                    if node.link[1] != NULL and node.link[1] != last:
+                        node = node.link[1]  # go right
+                    else:
                         func(<object>node.key, <object>node.value)
-                    go_down = False
+                        last = stack.pop()
+                        node = NULL
 
 
 cdef class _BinaryTree(_BaseTree):
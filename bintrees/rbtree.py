@@ -119,8 +119,16 @@ class RBTree(ABCTree):
         self._count += 1
         return Node(key, value)
 
+    def _init_built_node(self, node, depth, max_depth):
+        """Set color of a node created by _build_sorted_tree(): all levels
+        above the deepest level are complete and black, the nodes of the
+        deepest level are red.
+        """
+        node.red = depth == max_depth and depth > 0
+
     def insert(self, key, value):
         """T.insert(key, value) <==> T[key] = value, insert key, value into tree."""
+        self._snapshot = None
         if self._root is None:  # Empty tree case
             self._root = self._new_node(key, value)
             self._root.red = False  # make root black
@@ -173,6 +181,7 @@ class RBTree(ABCTree):
 
     def remove(self, key):
         """T.remove(key) <==> del T[key], remove item <key> from tree."""
+        self._snapshot = None
         if self._root is None:
             raise KeyError(str(key))
         head = Node()  # False tree root
@@ -225,6 +234,7 @@ class RBTree(ABCTree):
 
         # Replace and remove if found
         if found is not None:
+            value = found.value
             found.key = node.key
             found.value = node.value
             parent[int(parent.right is node)] = node[int(node.left is None)]
@@ -236,4 +246,5 @@ class RBTree(ABCTree):
         if self._root is not None:
             self._root.red = False
         if not found:
-            raise KeyError(str(key))
\ No newline at end of file
+            raise KeyError(str(key))
+        return value
\ No newline at end of file
@@ -16,8 +16,8 @@ class TreeSlice(object):
         self._stop = stop
 
     def __repr__(self):
-        tpl = "%s({%s})" % (self._tree.__class__.__name__, '%s')
-        return tpl % ", ".join( ("%r: %r" % item for item in self.items()) )
+        items = ["%r: %r" % item for item in self.items()]
+        return "%s({%s})" % (self._tree.__class__.__name__, ", ".join(items))
 
     def __contains__(self, key):
         if self._is_in_range(key):
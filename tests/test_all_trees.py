@@ -71,6 +71,17 @@ class CheckTree(object):
         tree2 = tree1.copy()
         self.assertEqual(list(tree1.items()), list(tree2.items()))
 
+    def test_006a_copy_is_independent(self):
+        keys = randomkeys(100)
+        tree1 = self.TREE_CLASS(zip(keys, keys))
+        tree2 = tree1.copy()
+        for key in keys[:50]:
+            del tree2[key]
+        tree2[-1] = -1
+        self.assertEqual(len(tree1), 100)
+        self.assertEqual(list(tree1.keys()), sorted(keys))
+        self.assertEqual(list(tree2.keys()), [-1] + sorted(keys[50:]))
+
     def test_007_to_dict(self):
         tree = self.TREE_CLASS(self.default_values2)
         d = dict(tree)
@@ -91,6 +102,14 @@ class CheckTree(object):
         tree.clear()
         self.assertEqual(len(tree), 0)
 
+    def test_009a_clear_deep_tree(self):
+        tree = self.TREE_CLASS()
+        for key in range(1500):  # degenerated BinaryTree deeper than the recursion limit
+            tree[key] = key
+        tree.clear()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(list(tree.keys()), [])
+
     def test_010_contains(self):
         tree1 = self.TREE_CLASS(self.default_values2)
         tree2 = self.TREE_CLASS(self.default_values1)
@@ -118,6 +137,30 @@ class CheckTree(object):
         self.assertEqual(list(tree.keys()), [1, 2, 3])
         self.assertEqual(list(tree.values()), ['one', 'zwei', 'three'])
 
+    def test_013a_update_big_batch(self):
+        tree = self.TREE_CLASS([(1, 'one'), (5, 'five')])
+        tree.update([(4, 'four'), (1, 'eins'), (3, 'three'), (4, 'vier')])
+        self.assertEqual(list(tree.items()), [(1, 'eins'), (3, 'three'), (4, 'vier'), (5, 'five')])
+        tree[2] = 'two'
+        del tree[5]
+        self.assertEqual(list(tree.keys()), [1, 2, 3, 4])
+
+    def test_013b_from_keys(self):
+        tree = self.TREE_CLASS.from_keys([3, 1, 2, 3, 1], 'x')
+        self.assertEqual(list(tree.items()), [(1, 'x'), (2, 'x'), (3, 'x')])
+
+    def test_013c_update_keeps_first_key_object(self):
+        def key_types(tree):
+            return [(type(key), value) for key, value in tree.items()]
+        tree = self.TREE_CLASS({1: 'a'})
+        tree.update({1.0: 'b'})  # big batch
+        self.assertEqual(key_types(tree), [(int, 'b')])
+        tree = self.TREE_CLASS([(1, 'a'), (1.0, 'b')])
+        self.assertEqual(key_types(tree), [(int, 'b')])
+        tree = self.TREE_CLASS([(1, 'a'), (2, 'b'), (3, 'c')])
+        tree.update([(2.0, 'x')])  # small batch
+        self.assertEqual(key_types(tree), [(int, 'a'), (int, 'x'), (int, 'c')])
+
     def test_014_unique_keys(self):
         tree = self.TREE_CLASS()
         for value in range(5):
@@ -188,6 +231,13 @@ class CheckTree(object):
         result = list(tree[:])
         self.assertEqual(list(result), [1, 2, 3])
 
+    def test_018h_valueslice(self):
+        tree = self.TREE_CLASS(self.default_values2)
+        self.assertEqual(list(tree.value_slice(2, 5)), [12, 57, 34])
+        self.assertEqual(list(tree.value_slice(2, 5, reverse=True)), [34, 57, 12])
+        self.assertEqual(list(tree.value_slice(None, None)), list(tree.values()))
+        self.assertEqual(list(self.TREE_CLASS().value_slice(None, None)), [])
+
     def test_019_values(self):
         tree = self.TREE_CLASS(self.default_values1)
         result = list(tree.values())
@@ -234,6 +284,42 @@ class CheckTree(object):
         self.assertEqual(tree.get(34, -10), 34)  # key exist
         self.assertEqual(tree.get(7, "DEFAULT"), "DEFAULT")
 
+    def test_025a_get_many(self):
+        tree = self.TREE_CLASS(self.default_values1)  # key == value
+        self.assertEqual(tree.get_many([57, 13, 12, 99], 'x'), [57, 'x', 12, 'x'])
+        self.assertEqual(self.TREE_CLASS().get_many([1, 2]), [None, None])
+
+    def test_025b_get_many_after_modification(self):
+        tree = self.TREE_CLASS(self.default_values1)  # key == value
+        self.assertEqual(tree.get_many([12, 13]), [12, None])
+        tree[13] = 'new'
+        del tree[12]
+        self.assertEqual(tree.get_many([12, 13]), [None, 'new'])
+        tree[13] = 'replaced'
+        self.assertEqual(tree.get_many([13]), ['replaced'])
+        tree.clear()
+        self.assertEqual(tree.get_many([13]), [None])
+
+    def test_025c_freeze(self):
+        tree = self.TREE_CLASS(self.default_values1)  # key == value
+        tree.freeze()
+        self.assertEqual(tree[12], 12)
+        self.assertTrue(57 in tree)
+        self.assertFalse(13 in tree)
+        tree[13] = 'new'
+        self.assertEqual(tree[13], 'new')
+        tree.freeze()
+        del tree[12]
+        with self.assertRaises(KeyError):
+            tree.get_value(12)
+        self.assertEqual(tree[13], 'new')
+
+    def test_025d_small_get_many_needs_no_snapshot(self):
+        tree = self.TREE_CLASS(zip(range(1000), range(1000)))
+        tree[1000] = 1000
+        self.assertEqual(tree.get_many([3, 1000, 2000]), [3, 1000, None])
+        self.assertIsNone(getattr(tree, '_snapshot', None))
+
     def test_026_remove_child_1(self):
         keys = [50, 25]
         tree = self.TREE_CLASS.fromkeys(keys)
@@ -363,6 +449,15 @@ class CheckTree(object):
         self.assertRaises(KeyError, tree.pop, 8)
         self.assertEqual(tree.pop(8, 99), 99)
 
+    def test_041a_pop_all(self):
+        keys = randomkeys(100)
+        tree = self.TREE_CLASS((key, str(key)) for key in keys)
+        shuffle(keys)
+        for count, key in enumerate(keys, 1):
+            self.assertEqual(tree.pop(key), str(key))
+            self.assertEqual(len(tree), 100 - count)
+        self.assertTrue(tree.is_empty())
+
     def test_042_pop_item(self):
         tree = self.TREE_CLASS(self.default_values2)
         d = dict()
@@ -592,6 +687,17 @@ class CheckTree(object):
         del tree[:]
         self.assertEqual(list(tree.keys()), [])
 
+    def test_078_delslice_big_range(self):
+        keys = randomkeys(200, 1000)
+        tree = self.TREE_CLASS(zip(keys, keys))
+        del tree[100:900]
+        expected = sorted(key for key in keys if key < 100 or key >= 900)
+        self.assertEqual(list(tree.keys()), expected)
+        self.assertEqual(len(tree), len(expected))
+        tree[500] = 500
+        del tree[950:]
+        self.assertEqual(list(tree.keys()), sorted([key for key in expected if key < 950] + [500]))
+
     def test_080_intersection(self):
         l1 = list(range(30))
         shuffle(l1)
@@ -667,6 +773,32 @@ class CheckTree(object):
         self.assertEqual(new_tree[44], 44)
         self.assertEqual(new_tree[1], 1)
 
+    def test_083a_multi_tree_union_values(self):
+        tree1 = self.TREE_CLASS([(1, 'a1'), (3, 'a3')])
+        tree2 = self.TREE_CLASS([(1, 'b1'), (2, 'b2'), (5, 'b5')])
+        tree3 = self.TREE_CLASS([(2, 'c2'), (4, 'c4')])
+        union_tree = tree1.union(tree2, tree3)
+        self.assertEqual(list(union_tree.items()), [(1, 'a1'), (2, 'b2'), (3, 'a3'), (4, 'c4'), (5, 'b5')])
+        self.assertEqual(list(tree1.intersection(tree2, tree3).keys()), [])
+        self.assertEqual(list(tree2.difference(tree1, tree3).keys()), [5])
+
+    def test_083b_subset_superset_disjoint(self):
+        tree1 = self.TREE_CLASS(zip(range(10), range(10)))
+        tree2 = self.TREE_CLASS(zip(range(3, 7), range(3, 7)))
+        tree3 = self.TREE_CLASS(zip(range(10, 20), range(10, 20)))
+        self.assertTrue(tree2.is_subset(tree1))
+        self.assertFalse(tree1.is_subset(tree2))
+        self.assertTrue(tree1.is_superset(tree2))
+        self.assertFalse(tree2.is_superset(tree1))
+        self.assertTrue(tree1.is_disjoint(tree3))
+        self.assertFalse(tree1.is_disjoint(tree2))
+        self.assertTrue(self.TREE_CLASS().is_subset(tree1))
+
+    def test_083c_set_methods_with_dict(self):
+        tree = self.TREE_CLASS(zip(range(10), range(10)))
+        self.assertTrue(tree.is_superset(dict.fromkeys([2, 4])))
+        self.assertEqual(list((tree & {3: 0, 30: 0}).items()), [(3, 3)])
+
     @unittest.skipIf(PYPY, "getrefcount() not supported by pypy.")
     def test_084_refcount_get(self):
         tree = self.TREE_CLASS(self.default_values1)  # key == value
@@ -781,6 +913,18 @@ class CheckTree(object):
         expected_keys = sorted(set(insert_keys))
         self.assertEqual(expected_keys, list(tree.keys()), "Data corruption in %s!" % tree.__class__)
 
+    def test_097a_number_keys(self):
+        keys = [2 ** 70, -2 ** 70, 2 ** 63, 2 ** 63 - 1, -2 ** 63, 0, -3, 1, 1.5, -0.5, 1e300, -1e300, 7.0]
+        tree = self.TREE_CLASS()
+        for key in keys:
+            tree[key] = key
+        self.assertEqual(list(tree.keys()), sorted(keys))
+        for key in keys:
+            self.assertEqual(tree[key], key)
+        self.assertEqual(tree[7], 7.0)  # 7 == 7.0
+        self.assertEqual(tree.floor_key(2 ** 63 + 1), 2 ** 63)
+        self.assertEqual(tree.ceiling_key(1.2), 1.5)
+
     def test_098_foreach(self):
         keys = []
         def collect(key, value):
@@ -790,6 +934,76 @@ class CheckTree(object):
         tree.foreach(collect)
         self.assertEqual(list(tree.keys()), list(sorted(keys)))
 
+    def test_099_foreach_orders(self):
+        tree = self.TREE_CLASS(self.default_values1)  # key == value
+        for order in (-1, 0, +1):
+            keys = []
+            tree.foreach(lambda k, v: keys.append(k), order)
+            self.assertEqual(sorted(keys), list(tree.keys()))
+
+    def test_099a_foreach_visit_order(self):
+        tree = self.TREE_CLASS()
+        for key in [5, 3, 8, 1, 4]:  # same shape for all tree classes
+            tree[key] = key
+        expected = {-1: [5, 3, 1, 4, 8], 0: [1, 3, 4, 5, 8], +1: [1, 4, 3, 8, 5]}
+        for order in (-1, 0, +1):
+            keys = []
+            tree.foreach(lambda k, v: keys.append(k), order)
+            self.assertEqual(keys, expected[order])
+
+    def test_099b_foreach_deep_tree(self):
+        tree = self.TREE_CLASS()
+        for key in range(100):  # degenerated BinaryTree
+            tree[key] = key
+        for order in (-1, 0, +1):
+            keys = []
+            tree.foreach(lambda k, v: keys.append(k), order)
+            self.assertEqual(sorted(keys), list(range(100)))
+        self.assertEqual(list(tree.keys(reverse=True)), list(range(99, -1, -1)))
+
+    def test_100_foreach_empty_tree(self):
+        keys = []
+        self.TREE_CLASS().foreach(lambda k, v: keys.append(k))
+        self.assertEqual(keys, [])
+
+
+class NamedRBTree(RBTree):
+    def __init__(self, name, items=None):
+        self.name = name
+        super(NamedRBTree, self).__init__(items)
+
+
+class TestSubclassWithInit(unittest.TestCase):
+    """Python trees with a custom __init__(), the bulk operations must not
+    create a new instance of the tree class.
+    """
+    def subclasses(self):
+        for base in (BinaryTree, AVLTree, RBTree):
+            class Named(base):
+                def __init__(self, name, items=None):
+                    self.name = name
+                    super(Named, self).__init__(items)
+            yield Named
+
+    def test_001_init_and_update(self):
+        for cls in self.subclasses():
+            tree = cls('x', [(1, 'a')])
+            tree.update({2: 2, 3: 3})
+            self.assertEqual(list(tree.items()), [(1, 'a'), (2, 2), (3, 3)])
+            self.assertEqual(tree.name, 'x')
+
+    def test_002_delete_range(self):
+        for cls in self.subclasses():
+            tree = cls('x', zip(range(10), range(10)))
+            del tree[1:]
+            self.assertEqual(list(tree.keys()), [0])
+            self.assertEqual(len(tree), 1)
+
+    def test_003_pickle(self):
+        tree = NamedRBTree('x', [(1, 'a'), (2, 'b')])
+        clone = pickle.loads(pickle.dumps(tree, -1))
+        self.assertEqual(list(clone.items()), [(1, 'a'), (2, 'b')])
+
 
 class TestBinaryTree(CheckTree, unittest.TestCase):
     TREE_CLASS = BinaryTree